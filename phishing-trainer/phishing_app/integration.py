@@ -6,11 +6,10 @@ sending phishing emails via the Jentic platform, which in turn uses Mailchimp.
 """
 
 import asyncio
-import json
 import logging
-from typing import Any, Dict, Tuple
+from functools import cached_property
+from typing import Any, Dict, List, Tuple
 
-import streamlit as st
 from jentic import Jentic, ExecutionRequest
 from jentic.lib.cfg import AgentConfig
 
@@ -24,6 +23,13 @@ from .config import (
 )
 from .templates import generate_email_template
 
+# Mailchimp limits how many conditions a segment may carry, which bounds how
+# many targets can be addressed by a single campaign execution.
+MAX_SEGMENT_CONDITIONS = 5
+
+# Upper bound on Jentic executions in flight while sending one campaign.
+MAX_CONCURRENT_SENDS = 4
+
 
 class JenticStandardAgent:
     """A client for the Jentic Standard Agent to send phishing emails."""
@@ -37,13 +43,14 @@ class JenticStandardAgent:
                      retrieved from environment variables.
         """
         self.api_key = api_key or get_jentic_api_key()
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:  # 'RuntimeError: There is no current event loop...'
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        self.client = Jentic(AgentConfig(agent_api_key=self.api_key)) if self.api_key else None
-        self.connected = self.client is not None
+        self.connected = bool(self.api_key)
+
+    @cached_property
+    def client(self) -> Jentic | None:
+        """The Jentic client, created on first use rather than on construction."""
+        if not self.api_key:
+            return None
+        return Jentic(AgentConfig(agent_api_key=self.api_key))
 
     async def send_phishing_email(self, company_name: str, scenario_type: str, target_email: str) -> Tuple[bool, Any]:
         """
@@ -57,13 +64,45 @@ class JenticStandardAgent:
         Returns:
             A tuple containing a boolean indicating success and the result of the Jentic execution.
         """
+        return await self.send_phishing_campaign(company_name, scenario_type, [target_email])
+
+    async def send_phishing_campaign(self, company_name: str, scenario_type: str, target_emails: List[str],
+                                     email_content: Dict[str, str] = None, client: Jentic = None) -> Tuple[bool, Any]:
+        """
+        Sends a phishing email to several targets with a single Jentic execution.
+
+        All targets are matched by one Mailchimp segment, so the whole group
+        costs one API round-trip instead of one per recipient. At most
+        MAX_SEGMENT_CONDITIONS targets fit in one segment; use
+        send_phishing_batches() for larger lists.
+
+        Args:
+            company_name: The name of the company being impersonated.
+            scenario_type: The type of phishing scenario.
+            target_emails: The email addresses of the targets.
+            email_content: Email content as returned by generate_email_template().
+                           If not provided, it is generated for this call.
+            client: The Jentic client to execute with. Defaults to self.client.
+
+        Returns:
+            A tuple containing a boolean indicating success and the result of the Jentic execution.
+
+        Raises:
+            ValueError: If more than MAX_SEGMENT_CONDITIONS targets are given.
+        """
+        if len(target_emails) > MAX_SEGMENT_CONDITIONS:
+            raise ValueError(
+                f"At most {MAX_SEGMENT_CONDITIONS} targets can be sent in one campaign, got {len(target_emails)}."
+            )
+
         if not self.connected:
             logging.error("Jentic client not connected. Please check your API key.")
             return False, {"error": "Jentic client not connected"}
         
         try:
             # Generate email content
-            email_content = generate_email_template(company_name, scenario_type)
+            if email_content is None:
+                email_content = generate_email_template(company_name, scenario_type)
             
             # Check for required settings
             list_id = get_mailchimp_list_id()
@@ -82,13 +121,14 @@ class JenticStandardAgent:
                         "list_id": list_id,
                         "segment_opts": {
                             "saved_segment_id": None,
-                            "match": "all",
+                            "match": "any",
                             "conditions": [
                                 {
                                     "field": "email_address",
                                     "op": "is",
                                     "value": target_email
                                 }
+                                for target_email in target_emails
                             ]
                         }
                     },
@@ -111,16 +151,51 @@ class JenticStandardAgent:
                 }
             )
             
-            result = await self.client.execute(request)
+            result = await (client or self.client).execute(request)
             
             if not result.success:
-                logging.error(f"Failed to send email: {result.error}")
+                logging.error("Failed to send email: %s", result.error)
                 return False, result.error
             
             return True, result
 
         except Exception as e:
-            error_msg = f"An error occurred with the Jentic client: {e}"
-            logging.error(error_msg)
+            logging.error("An error occurred with the Jentic client: %s", e)
             return False, {"error": str(e)}
 
+    async def send_phishing_batches(self, company_name: str, scenario_type: str, target_emails: List[str]) -> List[Tuple[List[str], bool, Any]]:
+        """
+        Sends a phishing email to any number of targets, batching and overlapping the sends.
+
+        Targets are split into groups of MAX_SEGMENT_CONDITIONS, and up to
+        MAX_CONCURRENT_SENDS groups are sent concurrently.
+
+        Args:
+            company_name: The name of the company being impersonated.
+            scenario_type: The type of phishing scenario.
+            target_emails: The email addresses of the targets.
+
+        Returns:
+            A list with one (target_emails, success, result) tuple per batch, in send order.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+        # Every batch carries the same content, so render and sanitize it once.
+        email_content = generate_email_template(company_name, scenario_type)
+
+        async def send_batch(batch: List[str]) -> Tuple[List[str], bool, Any]:
+            # Each batch needs its own client: on a timeout or connection error
+            # the SDK closes its HTTP client and retries, which would break the
+            # other batches in flight on a shared client and make the SDK re-POST
+            # them, sending duplicate campaigns.
+            client = Jentic(AgentConfig(agent_api_key=self.api_key)) if self.api_key else None
+            async with semaphore:
+                sent, result = await self.send_phishing_campaign(company_name, scenario_type, batch,
+                                                                 email_content, client)
+            return batch, sent, result
+
+        batches = [
+            target_emails[start:start + MAX_SEGMENT_CONDITIONS]
+            for start in range(0, len(target_emails), MAX_SEGMENT_CONDITIONS)
+        ]
+        return await asyncio.gather(*(send_batch(batch) for batch in batches))
+
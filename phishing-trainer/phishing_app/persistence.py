@@ -5,12 +5,12 @@ This module is responsible for all data persistence operations, including
 reading and writing campaign data from/to a JSON file. It can be extended
 in the future to use a database instead of a file-based storage.
 """
-import json
 import logging
-import uuid
+import time
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, Any
+
+import orjson
 
 
 def load_campaigns() -> Dict[str, Any]:
@@ -26,10 +26,9 @@ def load_campaigns() -> Dict[str, Any]:
         return {}
     
     try:
-        with open(campaigns_file, 'r') as f:
-            return json.load(f)
+        return orjson.loads(campaigns_file.read_bytes())
     except Exception as e:
-        logging.error(f"Error loading campaigns: {e}")
+        logging.error("Error loading campaigns: %s", e)
         return {}
 
 
@@ -44,10 +43,9 @@ def save_campaigns(campaigns: Dict[str, Any]) -> None:
     campaigns_file.parent.mkdir(exist_ok=True)
     
     try:
-        with open(campaigns_file, 'w') as f:
-            json.dump(campaigns, f, indent=2)
+        campaigns_file.write_bytes(orjson.dumps(campaigns, option=orjson.OPT_INDENT_2))
     except Exception as e:
-        logging.error(f"Error saving campaigns: {e}")
+        logging.error("Error saving campaigns: %s", e)
 
 
 
@@ -85,7 +83,7 @@ def track_click_and_save(campaign_id: str, recipient_id: str) -> bool:
             campaign = campaigns[campaign_id]
             for recipient in campaign['recipients']:
                 if recipient['id'] == recipient_id:
-                    recipient['click_ts'] = datetime.now().timestamp()
+                    recipient['click_ts'] = time.time()
                     recipient['status'] = 'clicked'
                     save_campaigns(campaigns)
                     return True
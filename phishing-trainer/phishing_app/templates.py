@@ -11,19 +11,24 @@ Available scenarios:
 - Document Share
 """
 
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Tuple
+
 import bleach
 
 
 # Allowed tags (only basic formatting and links)
 ALLOWED_TAGS = ['a', 'strong', 'em', 'p', 'ul', 'ol', 'li', 'br']
 
+# Allowed attributes per tag
+ALLOWED_ATTRIBUTES = {'a': ['href', 'title', 'target']}
+
 def sanitize_html(html: str) -> str:
     """Return a safe HTML string by stripping unwanted tags."""
     return bleach.clean(
         html,
         tags=ALLOWED_TAGS,
-        attributes={'a': ['href', 'title', 'target']},
+        attributes=ALLOWED_ATTRIBUTES,
         strip=True
     )
 
@@ -62,6 +67,10 @@ TEMPLATES = {
 }
 
 
+# Scenario names in display order, for selection widgets.
+SCENARIO_TYPES = tuple(TEMPLATES)
+
+
 def generate_email_template(company_name: str, scenario: str) -> Dict[str, str]:
     """
     Generates a phishing email subject and body from a template.
@@ -73,6 +82,31 @@ def generate_email_template(company_name: str, scenario: str) -> Dict[str, str]:
     Returns:
         A dictionary containing the email subject and HTML body.
     """
+    # Callers edit the returned dictionary in place, so hand out a fresh one
+    # around the cached strings.
+    subject, safe_body_html = _render_template(company_name, scenario)
+
+    return {
+        "subject": subject,
+        "body_html": safe_body_html
+    }
+
+
+@lru_cache(maxsize=128)
+def _render_template(company_name: str, scenario: str) -> Tuple[str, str]:
+    """
+    Formats and sanitizes a template for a company and scenario.
+
+    The result depends only on the arguments, so it is cached to avoid
+    re-running the HTML sanitizer for every campaign and send.
+
+    Args:
+        company_name: The name of the company to use in the email.
+        scenario: The name of the phishing scenario to use.
+
+    Returns:
+        A tuple containing the email subject and sanitized HTML body.
+    """
     template = TEMPLATES.get(scenario, TEMPLATES["Credential Theft"])
     
     # The placeholders in the template are for jinja2-like templating, 
@@ -86,10 +120,4 @@ def generate_email_template(company_name: str, scenario: str) -> Dict[str, str]:
     
     subject = template["subject"].format(company_name=company_name)
     body_html = template["body"].format(company_name=company_name, tracking_url='{tracking_url}')
-    safe_body_html = sanitize_html(body_html)
-
-    return {
-        "subject": subject,
-        "body_html": safe_body_html
-    }
-
+    return subject, sanitize_html(body_html)
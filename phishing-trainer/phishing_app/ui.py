@@ -9,8 +9,12 @@ for the application.
 
 import asyncio
 import logging
+import secrets
+import time
 import uuid
+from collections import Counter
 from datetime import datetime
+from itertools import islice
 
 import pandas as pd
 import streamlit as st
@@ -30,11 +34,10 @@ from phishing_app.config import (
 from phishing_app.integration import JenticStandardAgent
 from phishing_app.persistence import (
     generate_tracking_url,
-    load_campaigns,
     save_campaigns,
     track_click_and_save,
 )
-from phishing_app.templates import generate_email_template, TEMPLATES
+from phishing_app.templates import generate_email_template, SCENARIO_TYPES
 from phishing_app.utils import init_session_state, navigate_to, parse_targets
 
 
@@ -48,6 +51,27 @@ def configure_logging(debug_mode=False):
     )
 
 
+def format_timestamps(timestamps: pd.Series) -> pd.Series:
+    """
+    Formats a column of POSIX timestamps for display, using "-" for missing values.
+
+    Recipients of a campaign share a handful of distinct timestamps, so each
+    distinct value is formatted once and mapped back onto the column.
+
+    Args:
+        timestamps: A series of POSIX timestamps, possibly containing NaN.
+
+    Returns:
+        A series of "YYYY-MM-DD HH:MM" strings.
+    """
+    formatted = {
+        ts: datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
+        for ts in timestamps.dropna().unique()
+        if ts
+    }
+    return timestamps.map(formatted).fillna("-")
+
+
 def show_dashboard():
     """Renders the dashboard page."""
     st.title("Dashboard")
@@ -69,7 +93,10 @@ def show_dashboard():
     
     st.subheader("Recent Campaigns")
     
-    for campaign_id, campaign in list(st.session_state.campaigns.items())[-5:]:
+    # Campaigns are kept in creation order, so the most recent ones are the last
+    # entries; walk them from the end instead of copying the whole mapping.
+    recent_campaigns = list(islice(reversed(st.session_state.campaigns.items()), 5))
+    for campaign_id, campaign in reversed(recent_campaigns):
         with st.expander(f"{campaign['name']} ({campaign['created_at']})"):
             st.write(f"**Status:** {campaign['status']}")
             st.write(f"**Targets:** {len(campaign['recipients'])}")
@@ -93,7 +120,7 @@ def show_create_campaign():
         st.subheader("Phishing Scenario")
         company_name = st.text_input("Company/Brand Name", placeholder="Microsoft")
         
-        scenario_type = st.selectbox("Scenario Type", list(TEMPLATES.keys()))
+        scenario_type = st.selectbox("Scenario Type", SCENARIO_TYPES)
         
         submitted = st.form_submit_button("Create Campaign")
         
@@ -111,7 +138,9 @@ def show_create_campaign():
                 st.error("At least one valid target email is required.")
                 return
 
-            targets = [{'email': email, 'id': str(uuid.uuid4()), 'status': 'queued'} for email in validated_emails]
+            # Recipient IDs end up in every tracking URL, so use compact
+            # 128-bit URL-safe tokens rather than hyphenated UUID strings.
+            targets = [{'email': email, 'id': secrets.token_urlsafe(16), 'status': 'queued'} for email in validated_emails]
             
             campaign_id = str(uuid.uuid4())
             campaign = {
@@ -137,7 +166,7 @@ def show_create_campaign():
             st.session_state.campaigns[campaign_id] = campaign
             save_campaigns(st.session_state.campaigns)
             
-            logging.info(f"Campaign '{campaign_name}' created successfully.")
+            logging.info("Campaign '%s' created successfully.", campaign_name)
             st.success(f"Campaign '{campaign_name}' created successfully!")
             st.session_state.current_campaign = campaign_id
             st.session_state.page = "email_preview"
@@ -186,24 +215,31 @@ def show_email_preview():
 
         with st.spinner("Sending emails..."):
             success_count = 0
-            for recipient in campaign['recipients']:
-                try:
-                    sent, response = asyncio.run(jentic_agent.send_phishing_email(
-                        campaign['company']['name'],
-                        campaign['scenario']['type'],
-                        recipient['email']
-                    ))
-                    if sent:
-                        success_count += 1
+            recipients_by_email = {recipient['email']: recipient for recipient in campaign['recipients']}
+            try:
+                results = asyncio.run(jentic_agent.send_phishing_batches(
+                    campaign['company']['name'],
+                    campaign['scenario']['type'],
+                    list(recipients_by_email)
+                ))
+            except Exception as e:
+                logging.error("An error occurred while sending the campaign: %s", e)
+                st.session_state.debug_info = {"error": str(e)}
+                results = []
+
+            # All batches went out within the call above; stamp them alike.
+            send_ts = time.time()
+            for emails, sent, response in results:
+                if sent:
+                    success_count += len(emails)
+                    for email in emails:
+                        recipient = recipients_by_email[email]
                         recipient['status'] = 'sent'
-                        recipient['send_ts'] = datetime.now().timestamp()
-                        logging.info(f"Email sent to {recipient['email']}")
-                    else:
-                        logging.error(f"Failed to send email to {recipient['email']}. Response: {response}")
-                        st.session_state.debug_info = {"status_code": response.status_code, "body": response.text}
-                except Exception as e:
-                    logging.error(f"An error occurred while sending email to {recipient['email']}: {e}")
-                    st.session_state.debug_info = {"error": str(e)}
+                        recipient['send_ts'] = send_ts
+                    logging.info("Email sent to %s", ", ".join(emails))
+                else:
+                    logging.error("Failed to send email to %s. Response: %s", ", ".join(emails), response)
+                    st.session_state.debug_info = {"error": str(response)}
 
         campaign['status'] = 'active'
         st.session_state.campaigns[st.session_state.current_campaign] = campaign
@@ -221,22 +257,19 @@ def show_reports():
         st.info("No campaigns available.")
         return
     
-    campaign_options = {cid: campaign['name'] for cid, campaign in st.session_state.campaigns.items()}
+    campaigns = st.session_state.campaigns
+    campaign_ids = list(campaigns)
     
-    if st.session_state.current_campaign and st.session_state.current_campaign in campaign_options:
+    if st.session_state.current_campaign in campaigns:
         selected_campaign_id = st.session_state.current_campaign
     else:
-        selected_campaign_id = list(campaign_options.keys())[0] if campaign_options else None
-    
-    if not selected_campaign_id:
-        st.error("No campaigns available.")
-        return
+        selected_campaign_id = campaign_ids[0]
     
     selected_campaign = st.selectbox(
         "Select Campaign", 
-        options=list(campaign_options.keys()),
-        format_func=lambda x: campaign_options[x],
-        index=list(campaign_options.keys()).index(selected_campaign_id)
+        options=campaign_ids,
+        format_func=lambda cid: campaigns[cid]['name'],
+        index=campaign_ids.index(selected_campaign_id)
     )
     
     campaign = st.session_state.campaigns[selected_campaign]
@@ -251,8 +284,11 @@ def show_reports():
     st.subheader("Target Statistics")
     
     total = len(campaign['recipients'])
-    sent = sum(1 for r in campaign['recipients'] if r['status'] == 'sent')
-    clicked = sum(1 for r in campaign['recipients'] if r.get('click_ts') is not None)
+    # Clicked recipients are the only ones with a click timestamp, so a single
+    # status tally covers both counters.
+    status_counts = Counter(r['status'] for r in campaign['recipients'])
+    sent = status_counts['sent']
+    clicked = status_counts['clicked']
     
     click_rate = (clicked / sent * 100) if sent > 0 else 0
     
@@ -263,17 +299,15 @@ def show_reports():
     
     st.subheader("Target Details")
     
-    data = []
-    for recipient in campaign['recipients']:
-        data.append({
-            "Email": recipient['email'],
-            "Status": recipient['status'],
-            "Sent": datetime.fromtimestamp(recipient['send_ts']).strftime("%Y-%m-%d %H:%M") if recipient.get('send_ts') else "-",
-            "Clicked": datetime.fromtimestamp(recipient['click_ts']).strftime("%Y-%m-%d %H:%M") if recipient.get('click_ts') else "-"
-        })
+    df = pd.DataFrame.from_records(campaign['recipients'], columns=['email', 'status', 'send_ts', 'click_ts'])
     
-    if data:
-        df = pd.DataFrame(data)
+    if not df.empty:
+        df = pd.DataFrame({
+            "Email": df['email'],
+            "Status": df['status'],
+            "Sent": format_timestamps(df['send_ts']),
+            "Clicked": format_timestamps(df['click_ts'])
+        })
         st.dataframe(df)
     else:
         st.info("No target data available.")
@@ -363,6 +397,16 @@ def show_settings():
         st.info("Note: API keys are stored in the .env file in your project directory.")
 
 
+# Maps the page names used by navigate_to() to their render functions.
+PAGES = {
+    "dashboard": show_dashboard,
+    "create_campaign": show_create_campaign,
+    "email_preview": show_email_preview,
+    "reports": show_reports,
+    "settings": show_settings,
+}
+
+
 def main():
     """Main function for the Streamlit application."""
     st.set_page_config(
@@ -383,16 +427,9 @@ def main():
         st.divider()
         st.info("This is a basic phishing simulation tool for educational purposes only.")
     
-    if st.session_state.page == "dashboard":
-        show_dashboard()
-    elif st.session_state.page == "create_campaign":
-        show_create_campaign()
-    elif st.session_state.page == "email_preview":
-        show_email_preview()
-    elif st.session_state.page == "reports":
-        show_reports()
-    elif st.session_state.page == "settings":
-        show_settings()
+    render_page = PAGES.get(st.session_state.page)
+    if render_page:
+        render_page()
 
 
 if __name__ == "__main__":
@@ -7,12 +7,21 @@ state management.
 """
 
 import re
+
 import streamlit as st
 from email_validator import validate_email, EmailNotValidError
 from .persistence import load_campaigns
 
+# Cheap shape check run before the full validator, which performs DNS lookups.
+_EMAIL_SHAPE_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Separators accepted between addresses in the target list.
+_TARGET_SEPARATOR_RE = re.compile(r'[,]+')
+
 def validate_and_normalize_email(addr: str) -> str | None:
     """Return normalized email if valid, else None."""
+    if not _EMAIL_SHAPE_RE.match(addr):
+        return None
     try:
         valid = validate_email(addr, check_deliverability=True)
         # normalized email (lowercase domain, Unicode handling)
@@ -24,7 +33,7 @@ def parse_targets(target_emails: str) -> tuple[list[str], list[str]]:
     """Split comma/line-separated emails, validate, normalize, and de duplicate."""
     valid_emails = set()
     invalid_emails = set()
-    for raw in re.split(r'[,]+', target_emails):
+    for raw in _TARGET_SEPARATOR_RE.split(target_emails):
         email = validate_and_normalize_email(raw.strip())
         if email:
             valid_emails.add(email)
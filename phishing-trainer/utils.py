@@ -1,5 +1,3 @@
-import streamlit as st
-
 # Generate a tracking URL (simplified)
 def generate_tracking_url(campaign_id, recipient_id):
     base_url = "http://localhost:8501/track"